@@ -6,17 +6,15 @@ import android.content.Context
 import android.os.Build
 import android.os.Handler
 import android.os.Looper
+import android.os.SystemClock
 import android.util.Log
 import androidx.work.CoroutineWorker
 import androidx.work.WorkerParameters
-import com.google.gson.Gson
-import com.google.gson.reflect.TypeToken
 import kotlinx.coroutines.CancellationException
 import java.io.BufferedInputStream
 import java.io.File
 import java.io.FileOutputStream
 import java.lang.Double.min
-import java.lang.System.currentTimeMillis
 import java.net.HttpURLConnection
 import java.net.SocketException
 import java.net.URL
@@ -88,6 +86,11 @@ class BackgroundDownloadTask(
         )
     }
 
+    /** JSON string of this object, computed once as the task is immutable */
+    val jsonString: String by lazy {
+        BackgroundDownloaderPlugin.gson.toJson(toJsonMap())
+    }
+
     /** True if this task expects to provide progress updates */
     fun providesProgressUpdates(): Boolean {
         return progressUpdates == DownloadTaskProgressUpdates.progressUpdates ||
@@ -130,6 +133,8 @@ class DownloadWorker(
     companion object {
         const val TAG = "DownloadWorker"
         const val keyDownloadTask = "downloadTask"
+        const val bufferSize = 64 * 1024
+        private val mainHandler = Handler(Looper.getMainLooper())
 
         /**
          * Processes a change in status for the task
@@ -142,21 +147,10 @@ class DownloadWorker(
             status: DownloadTaskStatus
         ) {
             if (backgroundDownloadTask.providesStatusUpdates()) {
-                Handler(Looper.getMainLooper()).post {
-                    try {
-                        val gson = Gson()
-                        val arg = listOf<Any>(
-                            gson.toJson(backgroundDownloadTask.toJsonMap()),
-                            status.ordinal
-                        )
-                        BackgroundDownloaderPlugin.backgroundChannel?.invokeMethod(
-                            "statusUpdate",
-                            arg
-                        )
-                    } catch (e: Exception) {
-                        Log.w(TAG, "Exception trying to post status update: ${e.message}")
-                    }
-                }
+                postOnBackgroundChannel(
+                    "statusUpdate",
+                    listOf(backgroundDownloadTask.jsonString, status.ordinal)
+                )
             }
             // if task is in final state, process a final progressUpdate and remove from
             // persistent storage
@@ -209,18 +203,24 @@ class DownloadWorker(
             progress: Double
         ) {
             if (backgroundDownloadTask.providesProgressUpdates()) {
-                Handler(Looper.getMainLooper()).post {
-                    try {
-                        val gson = Gson()
-                        val arg =
-                            listOf<Any>(gson.toJson(backgroundDownloadTask.toJsonMap()), progress)
-                        BackgroundDownloaderPlugin.backgroundChannel?.invokeMethod(
-                            "progressUpdate",
-                            arg
-                        )
-                    } catch (e: Exception) {
-                        Log.w(TAG, "Exception trying to post progress update: ${e.message}")
-                    }
+                postOnBackgroundChannel(
+                    "progressUpdate",
+                    listOf(backgroundDownloadTask.jsonString, progress)
+                )
+            }
+        }
+
+        /**
+         * Posts [method] with [arg] to Flutter via the background channel
+         *
+         * The call is made on the main thread, as required by the MethodChannel
+         */
+        private fun postOnBackgroundChannel(method: String, arg: List<Any>) {
+            mainHandler.post {
+                try {
+                    BackgroundDownloaderPlugin.backgroundChannel?.invokeMethod(method, arg)
+                } catch (e: Exception) {
+                    Log.w(TAG, "Exception trying to post $method: ${e.message}")
                 }
             }
         }
@@ -228,12 +228,12 @@ class DownloadWorker(
 
 
     override suspend fun doWork(): Result {
-        val gson = Gson()
         val downloadTaskJsonMapString = inputData.getString(keyDownloadTask)
-
-        val mapType = object : TypeToken<Map<String, Any>>() {}.type
         val downloadTask = BackgroundDownloadTask(
-            gson.fromJson(downloadTaskJsonMapString, mapType)
+            BackgroundDownloaderPlugin.gson.fromJson(
+                downloadTaskJsonMapString,
+                BackgroundDownloaderPlugin.mapType
+            )
         )
         Log.i(TAG, " Starting download for taskId ${downloadTask.taskId}")
         val filePath = pathToFileForTask(downloadTask)
@@ -277,11 +277,11 @@ class DownloadWorker(
                     dir
                 )
                 try {
-                    BufferedInputStream(url.openStream()).use { `in` ->
+                    BufferedInputStream(url.openStream(), bufferSize).use { `in` ->
                         FileOutputStream(tempFile).use { fileOutputStream ->
-                            val dataBuffer = ByteArray(8096)
+                            val dataBuffer = ByteArray(bufferSize)
                             var bytesRead: Int
-                            while (`in`.read(dataBuffer, 0, 8096).also { bytesRead = it } != -1) {
+                            while (`in`.read(dataBuffer, 0, bufferSize).also { bytesRead = it } != -1) {
                                 if (isStopped) {
                                     break
                                 }
@@ -289,12 +289,14 @@ class DownloadWorker(
                                 bytesReceivedTotal += bytesRead
                                 val progress =
                                     min(bytesReceivedTotal.toDouble() / contentLength, 0.999)
+                                // always send an update after the first read, regardless
+                                // of how many bytes that read returned
                                 if (contentLength > 0 &&
-                                    (bytesReceivedTotal < 10000 || (progress - lastProgressUpdate > 0.02 && currentTimeMillis() > nextProgressUpdateTime))
+                                    (lastProgressUpdate == 0.0 || bytesReceivedTotal < 10000 || (progress - lastProgressUpdate > 0.02 && SystemClock.elapsedRealtime() > nextProgressUpdateTime))
                                 ) {
                                     processProgressUpdate(downloadTask, progress)
                                     lastProgressUpdate = progress
-                                    nextProgressUpdateTime = currentTimeMillis() + 500
+                                    nextProgressUpdateTime = SystemClock.elapsedRealtime() + 500
                                 }
                             }
                         }
@@ -311,7 +313,8 @@ class DownloadWorker(
                                 destFile.toPath(),
                                 StandardCopyOption.REPLACE_EXISTING
                             )
-                        } else {
+                        } else if (!tempFile.renameTo(destFile)) {
+                            // rename fails across filesystems, so fall back to copying
                             tempFile.copyTo(destFile, overwrite = true)
                             tempFile.delete()
                         }
@@ -136,9 +136,11 @@ public class Downloader: NSObject, FlutterPlugin, FlutterApplicationLifeCycleDel
     let args = call.arguments as! [Any]
     let jsonString = args[0] as! String
     os_log("methodEnqueue with %@", log: log, type: .debug, jsonString)
-    guard let backgroundDownloadTask = downloadTaskFrom(jsonString: jsonString)
-    else {
-      os_log("Could not decode %@ to downloadTask", log: log, jsonString)
+    let backgroundDownloadTask: BackgroundDownloadTask
+    do {
+      backgroundDownloadTask = try downloadTaskFrom(jsonString: jsonString)
+    } catch {
+      os_log("Could not decode %@ to downloadTask: %@", log: log, jsonString, error.localizedDescription)
       result(false)
       return
     }
@@ -262,8 +264,10 @@ public class Downloader: NSObject, FlutterPlugin, FlutterApplicationLifeCycleDel
   //MARK: URLSessionDownloadTask delegate methods
   
   public func urlSession(_ session: URLSession, downloadTask: URLSessionDownloadTask, didWriteData bytesWritten: Int64, totalBytesWritten: Int64, totalBytesExpectedToWrite: Int64) {
-    guard let backgroundDownloadTask = self.getTaskFrom(urlSessionDownloadTask: downloadTask) else {return}
-    if totalBytesExpectedToWrite != NSURLSessionTransferSizeUnknown && Date() > nextProgressUpdateTime[backgroundDownloadTask.taskId] ?? Date(timeIntervalSince1970: 0) {
+    // progress cannot be computed without a known size, so don't decode the task
+    guard totalBytesExpectedToWrite != NSURLSessionTransferSizeUnknown,
+          let backgroundDownloadTask = self.getTaskFrom(urlSessionDownloadTask: downloadTask) else {return}
+    if Date() > nextProgressUpdateTime[backgroundDownloadTask.taskId] ?? Date(timeIntervalSince1970: 0) {
       let progress = min(Double(totalBytesWritten) / Double(totalBytesExpectedToWrite), 0.999)
       if progress - (lastProgressUpdate[backgroundDownloadTask.taskId] ?? 0.0) > 0.02 {
         processProgressUpdate(backgroundDownloadTask: backgroundDownloadTask, progress: progress)
@@ -338,11 +342,11 @@ public class Downloader: NSObject, FlutterPlugin, FlutterApplicationLifeCycleDel
   }
 
   
-  /// Returns a BackgroundDownloadTask from the supplied jsonString, or nil
-  private func downloadTaskFrom(jsonString: String) -> BackgroundDownloadTask? {
-    let decoder = JSONDecoder()
-    let backgroundDownloadTasks: BackgroundDownloadTask? = try? decoder.decode(BackgroundDownloadTask.self, from: (jsonString).data(using: .utf8)!)
-    return backgroundDownloadTasks
+  /// Returns a BackgroundDownloadTask from the supplied jsonString
+  ///
+  /// Throws if the jsonString cannot be decoded, leaving logging to the caller
+  private func downloadTaskFrom(jsonString: String) throws -> BackgroundDownloadTask {
+    return try JSONDecoder().decode(BackgroundDownloadTask.self, from: Data(jsonString.utf8))
   }
   
   /// Returns a JSON string for this BackgroundDownloadTask, or nil
@@ -448,13 +452,11 @@ public class Downloader: NSObject, FlutterPlugin, FlutterApplicationLifeCycleDel
   
   /// Return the task corresponding to the URLSessionTask, or nil if it cannot be matched
   private func getTaskFrom(urlSessionDownloadTask: URLSessionTask) -> BackgroundDownloadTask? {
-    let decoder = JSONDecoder()
-    guard let jsonData = urlSessionDownloadTask.taskDescription?.data(using: .utf8)
-            
+    guard let jsonString = urlSessionDownloadTask.taskDescription
     else {
       return nil
     }
-    return try? decoder.decode(BackgroundDownloadTask.self, from: jsonData)
+    return try? downloadTaskFrom(jsonString: jsonString)
   }
   
   /// Creates a urlSession